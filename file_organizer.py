@@ -5,33 +5,71 @@ Organizes files into: [Category]/[Year]/[Month]/files
 """
 
 import os
+import errno
 import json
 import shutil
 import stat
-import tkinter as tk
-from tkinter import filedialog, messagebox
 from datetime import datetime
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, astuple
 from typing import Callable, Optional
 from enum import Enum
 import ctypes
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
 import time
 import math
 
 try:
-    import ttkbootstrap as ttk
-    from ttkbootstrap.constants import *
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Kernel32 functions bound once with explicit prototypes, so calls skip the
+# windll attribute lookup and ctypes' default argument conversion
+if os.name == 'nt':
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _GetFileAttributesW = _kernel32.GetFileAttributesW
+    _GetFileAttributesW.argtypes = [ctypes.c_wchar_p]
+    _GetFileAttributesW.restype = ctypes.c_uint32
+    _CopyFileExW = _kernel32.CopyFileExW
+    _CopyFileExW.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_void_p,
+                             ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint32]
+    _CopyFileExW.restype = ctypes.c_int
+
+INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+
+# GUI toolkit, imported by _load_gui() when the app starts so that the
+# organizer and backup logic can be imported without loading tkinter
+tk = None
+ttk = None
+filedialog = None
+messagebox = None
+ScrolledFrame = None
+TTKBOOTSTRAP_AVAILABLE = False
+
+
+def _load_gui():
+    """Import tkinter, and ttkbootstrap when installed, into the module namespace."""
+    global tk, ttk, filedialog, messagebox, ScrolledFrame, TTKBOOTSTRAP_AVAILABLE
+    if tk is not None:
+        return
+    import tkinter as tk
+    from tkinter import filedialog, messagebox
     try:
-        from ttkbootstrap.widgets.scrolled import ScrolledFrame
+        import ttkbootstrap as ttk
+        try:
+            from ttkbootstrap.widgets.scrolled import ScrolledFrame
+        except ImportError:
+            from ttkbootstrap.scrolled import ScrolledFrame
+        TTKBOOTSTRAP_AVAILABLE = True
     except ImportError:
-        from ttkbootstrap.scrolled import ScrolledFrame
-    TTKBOOTSTRAP_AVAILABLE = True
-except ImportError:
-    from tkinter import ttk
-    TTKBOOTSTRAP_AVAILABLE = False
+        from tkinter import ttk
+        TTKBOOTSTRAP_AVAILABLE = False
+
 
 # Directory where backup files are stored (same as script location)
 BACKUP_DIR = Path(__file__).parent / "backups"
@@ -43,6 +81,21 @@ APP_VERSION = "2.4.0"
 # Windows path length limit
 MAX_PATH_LENGTH = 260
 
+# Worker threads for scanning top-level subdirectories in parallel
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Files each scan worker counts on its own before adding them to the shared total
+SCAN_PROGRESS_BATCH = 256
+
+# Worker threads for moving files (one destination directory per worker at a time)
+MOVE_WORKERS = 8
+
+# Folder lines shown in the preview tree before the rest are summarized
+PREVIEW_TREE_MAX_LINES = 200
+
+# Consecutive denied moves out of one folder before the rest of it is skipped untried
+DENIED_MOVES_LIMIT = 3
+
 # System folders to warn about
 SYSTEM_FOLDERS = {
     "windows", "program files", "program files (x86)", "programdata",
@@ -149,8 +202,12 @@ MONTH_NAMES = {
     9: '09-September', 10: '10-October', 11: '11-November', 12: '12-December'
 }
 
+# Folder names that make up the organized structure
+VALID_CATEGORIES = frozenset(EXTENSION_CATEGORIES.values()) | {'Other', 'No Extension'}
+VALID_MONTHS = frozenset(MONTH_NAMES.values()) | {'Unknown'}
 
-@dataclass
+
+@dataclass(slots=True)
 class FileMove:
     """Represents a planned file move operation."""
     source: Path
@@ -158,6 +215,9 @@ class FileMove:
     category: str
     year: int
     month: int
+    # Cached at scan time so the move and preview loops never re-parse the paths
+    name: str
+    dest_dir: Path
 
 
 @dataclass
@@ -188,8 +248,8 @@ class BackupInfo:
     """Information about a backup file."""
     filepath: Path
     timestamp: datetime
-    source_folder: str
-    file_count: int
+    source_folder: Optional[str] = None  # None until the backup file has been read
+    file_count: Optional[int] = None
 
 
 @dataclass
@@ -212,13 +272,25 @@ class FolderMove:
     file_count: int  # Number of files in the folder
 
 
-def is_hidden_file(file_path: Path) -> bool:
-    """Check if a file is hidden."""
+def get_file_attributes(file_path: Path, entry: Optional[os.DirEntry] = None) -> int:
+    """Get Windows file attributes, or -1. Pass entry to use its cached stat."""
+    if entry is not None:
+        # scandir fills this in from the directory listing, so no syscall is needed
+        try:
+            return entry.stat(follow_symlinks=False).st_file_attributes
+        except (OSError, AttributeError):
+            pass
+    attrs = _GetFileAttributesW(str(file_path))
+    return -1 if attrs == INVALID_FILE_ATTRIBUTES else attrs
+
+
+def is_hidden_file(file_path: Path, entry: Optional[os.DirEntry] = None) -> bool:
+    """Check if a file is hidden. Pass entry to use its cached attributes."""
     try:
         if file_path.name.startswith('.'):
             return True
         if os.name == 'nt':
-            attrs = ctypes.windll.kernel32.GetFileAttributesW(str(file_path))
+            attrs = get_file_attributes(file_path, entry)
             if attrs != -1:
                 return bool(attrs & 0x2)
     except Exception:
@@ -226,11 +298,11 @@ def is_hidden_file(file_path: Path) -> bool:
     return False
 
 
-def is_system_file(file_path: Path) -> bool:
-    """Check if a file is a system file."""
+def is_system_file(file_path: Path, entry: Optional[os.DirEntry] = None) -> bool:
+    """Check if a file is a system file. Pass entry to use its cached attributes."""
     try:
         if os.name == 'nt':
-            attrs = ctypes.windll.kernel32.GetFileAttributesW(str(file_path))
+            attrs = get_file_attributes(file_path, entry)
             if attrs != -1:
                 return bool(attrs & 0x4)
     except Exception:
@@ -238,21 +310,21 @@ def is_system_file(file_path: Path) -> bool:
     return False
 
 
-def is_file_locked(file_path: Path) -> bool:
-    """Check if a file is locked/in use."""
-    try:
-        with open(file_path, 'r+b'):
-            pass
-        return False
-    except (IOError, PermissionError):
+def is_file_in_use_error(error: OSError) -> bool:
+    """Check if a failed move means another process has the file open."""
+    # 32 and 33 are ERROR_SHARING_VIOLATION and ERROR_LOCK_VIOLATION
+    if getattr(error, 'winerror', None) in (32, 33) or error.errno == errno.EBUSY:
         return True
-    except Exception:
-        return False
+    message = str(error).lower()
+    return "being used" in message or "in use" in message
 
 
-def is_symlink_or_shortcut(file_path: Path) -> bool:
-    """Check if a file is a symlink or Windows shortcut."""
-    return file_path.is_symlink() or file_path.suffix.lower() == '.lnk'
+def is_symlink_or_shortcut(file_path: Path, entry: Optional[os.DirEntry] = None) -> bool:
+    """Check if a file is a symlink or Windows shortcut. Pass entry to use its cached type."""
+    name = file_path.name
+    if len(name) > 4 and name.lower().endswith('.lnk'):
+        return True
+    return entry.is_symlink() if entry is not None else file_path.is_symlink()
 
 
 def is_system_folder(folder_path: Path) -> bool:
@@ -273,19 +345,12 @@ def is_system_folder(folder_path: Path) -> bool:
     return False
 
 
-def get_compound_extension(file_path: Path) -> Optional[str]:
-    """Get compound extension like .tar.gz if applicable."""
-    name_lower = file_path.name.lower()
-    for compound_ext in COMPOUND_EXTENSIONS:
-        if name_lower.endswith(compound_ext):
-            return compound_ext
-    return None
-
-
 def count_files_in_folder(folder_path: Path) -> int:
     """Count files in a folder (non-recursive, quick count)."""
     try:
-        return sum(1 for f in folder_path.iterdir() if f.is_file())
+        # scandir reports the entry type from the listing, so only symlinks need a stat
+        with os.scandir(folder_path) as entries:
+            return sum(1 for entry in entries if entry.is_file())
     except Exception:
         return 0
 
@@ -293,30 +358,107 @@ def count_files_in_folder(folder_path: Path) -> int:
 def delete_empty_folders(folder_path: Path, progress_callback: Callable[[str], None] = None) -> int:
     """Delete empty folders recursively."""
     deleted = 0
-    for dirpath, dirnames, filenames in os.walk(str(folder_path), topdown=False):
-        dir_path = Path(dirpath)
-        if dir_path == folder_path:
+    removed = set()
+    top = str(folder_path)
+    # Bottom-up, a folder is empty when it has no files and every subfolder
+    # was removed, so the walk's own listing answers that without re-reading it
+    for dirpath, dirnames, filenames in os.walk(top, topdown=False, followlinks=False):
+        if dirpath == top:
+            continue
+        if filenames or any(os.path.join(dirpath, d) not in removed for d in dirnames):
             continue
         try:
-            if not any(dir_path.iterdir()):
-                if progress_callback:
-                    progress_callback(f"Deleting empty folder: {dir_path.name}")
-                dir_path.rmdir()
-                deleted += 1
+            if progress_callback:
+                progress_callback(f"Deleting empty folder: {os.path.basename(dirpath)}")
+            os.rmdir(dirpath)
+            removed.add(dirpath)
+            deleted += 1
         except (PermissionError, OSError):
             pass
     return deleted
 
 
+def move_path(source: str, destination: str):
+    """Move a file or folder with a single rename, falling back to a copy across devices."""
+    try:
+        # os.rename rather than os.replace: on Windows it refuses to overwrite
+        os.rename(source, destination)
+    except OSError as e:
+        # Attempting the rename is cheaper than comparing st_dev up front: a
+        # cross-device rename fails with EXDEV without touching any data
+        if e.errno != errno.EXDEV:
+            raise
+        if os.name == 'nt' and os.path.isfile(source):
+            copy_file_windows(source, destination)
+            try:
+                os.unlink(source)
+            except OSError:
+                # Still open elsewhere: drop the copy rather than leave the file twice
+                os.unlink(destination)
+                raise
+        else:
+            # Elsewhere shutil already copies in the kernel (sendfile on Linux)
+            shutil.move(source, destination)
+            if hasattr(os, 'posix_fadvise') and os.path.isfile(destination):
+                drop_file_cache(destination)
+
+
+def drop_file_cache(path: str):
+    """Ask the kernel to evict a freshly copied file from the page cache."""
+    # Large media copies would otherwise push the user's working set out of RAM.
+    # On Linux DONTNEED also starts writeback of the dirty pages it cannot drop yet
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def copy_file_windows(source: str, destination: str):
+    """Copy a file with CopyFileExW, keeping its timestamps and attributes."""
+    # Much faster than shutil's buffered copy loop on Python versions before 3.14.
+    # 0x1 is COPY_FILE_FAIL_IF_EXISTS, matching os.rename's refusal to overwrite
+    if not _CopyFileExW(source, destination, None, None, None, 0x1):
+        raise ctypes.WinError(ctypes.get_last_error())
+
+
+def json_dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def json_load_file(filepath: Path):
+    """Parse a JSON file, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(filepath.read_bytes())
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 class FileOrganizer:
     """Handles the file organization logic."""
 
     def __init__(self, source_folder: str, sort_mode: SortMode = SortMode.BY_BOTH,
                  options: ScanOptions = None):
-        self.source_folder = Path(source_folder)
+        # Absolute up front so planned paths can be logged without resolve()
+        self.source_folder = Path(os.path.abspath(source_folder))
         self.sort_mode = sort_mode
         self.options = options or ScanOptions()
         self._cancel_requested = False
+        self._dir_names_cache: dict[Path, set[str]] = {}
+        # Last duplicate counter handed out per (directory, normcased name)
+        self._name_counters: dict[tuple[Path, str], int] = {}
+        self._parent_cache: dict[tuple[str, int, int], Path] = {}
+        # st_mtime_ns of every directory listed since the last scan started
+        self._dir_mtimes: dict[str, int] = {}
+        self._max_year = datetime.now().year + 1
 
     def request_cancel(self):
         self._cancel_requested = True
@@ -324,163 +466,265 @@ class FileOrganizer:
     def reset_cancel(self):
         self._cancel_requested = False
 
-    def get_category(self, file_path: Path) -> str:
-        compound_ext = get_compound_extension(file_path)
-        if compound_ext:
-            return COMPOUND_EXTENSIONS[compound_ext]
-        ext = file_path.suffix.lower()
-        if not ext:
+    def get_category(self, name: str) -> str:
+        """Get the category for a file name (works on the raw name, no Path needed)."""
+        dot = name.rfind('.')
+        # Compound extensions are all two parts (.tar.gz), so only names with a
+        # second dot need checking, and only their tail gets lowercased
+        if dot > 0:
+            prev = name.rfind('.', 0, dot)
+            if prev >= 0:
+                category = COMPOUND_EXTENSIONS.get(name[prev:].lower())
+                if category:
+                    return category
+        # Same rules as Path.suffix: leading or trailing dots are not extensions
+        if dot <= 0 or dot == len(name) - 1:
             return 'No Extension'
-        return EXTENSION_CATEGORIES.get(ext, 'Other')
-
-    def get_file_date(self, file_path: Path) -> tuple[datetime, bool]:
+        ext = name[dot:]
+        # Most extensions are already lowercase; only lowercase on a miss
+        category = EXTENSION_CATEGORIES.get(ext)
+        if category is None:
+            category = EXTENSION_CATEGORIES.get(ext.lower(), 'Other')
+        return category
+
+    def _get_file_time(self, stat_info: os.stat_result) -> Optional[time.struct_time]:
+        """Get the local time of a file's date from a stat result, or None if invalid."""
         try:
-            stat_info = file_path.stat()
             ctime = stat_info.st_ctime
             mtime = stat_info.st_mtime
-            timestamp = min(ctime, mtime)
-            dt = datetime.fromtimestamp(timestamp)
-            if dt.year < 1980 or dt.year > datetime.now().year + 1:
-                dt = datetime.fromtimestamp(mtime)
-                if dt.year < 1980 or dt.year > datetime.now().year + 1:
-                    return (None, False)
-            return (dt, True)
+            t = time.localtime(min(ctime, mtime))
+            if t.tm_year < 1980 or t.tm_year > self._max_year:
+                t = time.localtime(mtime)
+                if t.tm_year < 1980 or t.tm_year > self._max_year:
+                    return None
+            return t
         except (OSError, ValueError, OverflowError):
-            return (None, False)
-
-    def get_destination_path(self, file_path: Path, file_date: Optional[datetime] = None) -> Path:
-        category = self.get_category(file_path)
-        if file_date:
-            year = str(file_date.year)
-            month = MONTH_NAMES[file_date.month]
-        else:
-            year = "Unknown"
-            month = "Unknown"
-
-        if self.sort_mode == SortMode.BY_TYPE:
-            return self.source_folder / category / file_path.name
-        elif self.sort_mode == SortMode.BY_DATE:
-            return self.source_folder / year / month / file_path.name
-        else:
-            return self.source_folder / category / year / month / file_path.name
+            return None
+
+    def get_file_year_month(self, stat_info: os.stat_result) -> tuple[int, int]:
+        """Get a file's (year, month) from a stat result, or (0, 0) if the date is invalid."""
+        t = self._get_file_time(stat_info)
+        return (t.tm_year, t.tm_mon) if t else (0, 0)
+
+    def _get_destination_dir(self, category: str, year: int, month: int) -> Path:
+        """Get the destination folder for a category/year/month (0 = unknown), cached."""
+        key = (category, year, month)
+        parent = self._parent_cache.get(key)
+        if parent is None:
+            year_name = str(year) if year else "Unknown"
+            month_name = MONTH_NAMES[month] if month else "Unknown"
+            if self.sort_mode == SortMode.BY_TYPE:
+                parent = self.source_folder / category
+            elif self.sort_mode == SortMode.BY_DATE:
+                parent = self.source_folder / year_name / month_name
+            else:
+                parent = self.source_folder / category / year_name / month_name
+            parent = self._parent_cache.setdefault(key, parent)
+        return parent
 
     def check_path_length(self, dest_path: Path) -> bool:
         return len(str(dest_path)) <= MAX_PATH_LENGTH
 
-    def get_unique_destination(self, dest_path: Path) -> Path:
-        if not dest_path.exists():
-            return dest_path
-        stem = dest_path.stem
-        suffix = dest_path.suffix
-        parent = dest_path.parent
-        counter = 1
+    def _existing_names(self, directory: Path) -> set[str]:
+        """Get the (normcased) names in a directory, listing it only once per run."""
+        names = self._dir_names_cache.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as entries:
+                    names = {os.path.normcase(entry.name) for entry in entries}
+            except OSError:
+                names = set()
+            self._dir_names_cache[directory] = names
+        return names
+
+    def _reserve_name(self, parent: Path, name: str) -> Optional[str]:
+        """
+        Reserve a file name in parent for this run.
+
+        Returns None when name itself is free, so the common case builds no new
+        path, or else the first free numbered variant of it.
+        """
+        names = self._existing_names(parent)
+        key = os.path.normcase(name)
+        if key not in names:
+            names.add(key)
+            return None
+        # Only duplicates get here, so parsing the name with Path is fine
+        stem = Path(name).stem
+        suffix = Path(name).suffix
+        # Resume after the last counter used for this name, so k duplicates of
+        # one name cost O(k) probes in total rather than O(k^2)
+        counter_key = (parent, key)
+        counter = self._name_counters.get(counter_key, 0) + 1
         while True:
             new_name = f"{stem}_{counter}{suffix}"
-            new_path = parent / new_name
-            if not new_path.exists():
-                return new_path
+            if os.path.normcase(new_name) not in names:
+                # Reserve the name so later moves into this directory see it
+                names.add(os.path.normcase(new_name))
+                self._name_counters[counter_key] = counter
+                return new_name
             counter += 1
             if counter > 10000:
                 raise RuntimeError("Too many duplicate files")
 
     def is_in_correct_location(self, file_path: Path, dest_path: Path) -> bool:
-        try:
-            return file_path.resolve() == dest_path.resolve()
-        except OSError:
-            return False
+        # Both paths are built from source_folder, so compare them directly
+        # instead of resolving each one (two extra stat calls per file).
+        # Path equality is case-insensitive on Windows, like the file system
+        return file_path == dest_path
 
-    def is_in_organized_structure(self, file_path: Path) -> bool:
-        try:
-            relative = file_path.relative_to(self.source_folder)
-        except ValueError:
-            return False
-        parts = relative.parts
-        valid_categories = set(EXTENSION_CATEGORIES.values()) | {'Other', 'No Extension'}
+    def _organized_depth(self) -> int:
+        """Number of directory levels in the organized structure for the current mode."""
+        if self.sort_mode == SortMode.BY_TYPE:
+            return 1
+        if self.sort_mode == SortMode.BY_DATE:
+            return 2
+        return 3
 
+    def _is_organized_prefix(self, parts: tuple) -> bool:
+        """Check if the leading directory parts match the organized structure."""
         if self.sort_mode == SortMode.BY_TYPE:
-            if len(parts) >= 2:
-                return parts[0] in valid_categories
-        elif self.sort_mode == SortMode.BY_DATE:
-            if len(parts) >= 3:
-                year, month = parts[0], parts[1]
-                if (year.isdigit() and len(year) == 4) or year == "Unknown":
-                    if month in MONTH_NAMES.values() or month == "Unknown":
-                        return True
+            return parts[0] in VALID_CATEGORIES
+        if self.sort_mode == SortMode.BY_DATE:
+            year, month = parts[0], parts[1]
         else:
-            if len(parts) >= 4:
-                category, year, month = parts[0], parts[1], parts[2]
-                if category in valid_categories:
-                    if (year.isdigit() and len(year) == 4) or year == "Unknown":
-                        if month in MONTH_NAMES.values() or month == "Unknown":
-                            return True
+            if parts[0] not in VALID_CATEGORIES:
+                return False
+            year, month = parts[1], parts[2]
+        if (year.isdigit() and len(year) == 4) or year == "Unknown":
+            if month in VALID_MONTHS:
+                return True
         return False
 
-    def check_file_accessibility(self, file_path: Path, check_lock: bool = True) -> Optional[SkipReason]:
-        """Check if file can be accessed. Set check_lock=False for faster scanning."""
+    def check_file_accessibility(self, file_path: Path,
+                                 entry: Optional[os.DirEntry] = None) -> Optional[SkipReason]:
+        """
+        Check if file can be accessed. Files in use are detected when the move fails.
+
+        Pass the scandir entry when available so the symlink, hidden and system
+        checks read its cached type and attributes instead of querying the file.
+        """
         try:
-            if not self.options.include_symlinks and is_symlink_or_shortcut(file_path):
+            if not self.options.include_symlinks and is_symlink_or_shortcut(file_path, entry):
                 return SkipReason.SYMLINK
-            if not self.options.include_hidden and is_hidden_file(file_path):
+            if not self.options.include_hidden and is_hidden_file(file_path, entry):
                 return SkipReason.HIDDEN_FILE
-            if is_system_file(file_path):
+            if is_system_file(file_path, entry):
                 return SkipReason.SYSTEM_FILE
-            # Only check lock when actually moving (expensive operation)
-            if check_lock and is_file_locked(file_path):
-                return SkipReason.FILE_IN_USE
         except PermissionError:
             return SkipReason.PERMISSION_DENIED
         except Exception:
             return SkipReason.PERMISSION_DENIED
         return None
 
-    def _scan_directory_fast(self, directory: Path, recursive: bool = True):
-        """Fast directory scan using os.scandir. Set recursive=False for root only."""
+    def _scan_directory_fast(self, directory: Path, recursive: bool = True,
+                             prune_organized: bool = False, rel_parts: tuple = ()):
+        """
+        Fast iterative directory scan using os.scandir, yielding file DirEntry objects.
+
+        Set recursive=False for root only. With prune_organized=True, subtrees that
+        already match the organized structure are skipped without being listed;
+        rel_parts gives the position of directory relative to the source folder.
+        Use entry.stat() on the results: it is cached per entry and comes from the
+        directory listing itself on Windows.
+        """
+        depth = self._organized_depth()
+        stack = [(str(directory), rel_parts)]
+        while stack:
+            dir_path, rel_parts = stack.pop()
+            subdirs = []
+            try:
+                # Taken before listing, so a change made during the scan still shows up
+                self._dir_mtimes[dir_path] = os.stat(dir_path).st_mtime_ns
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        if self._cancel_requested:
+                            return
+                        try:
+                            if entry.is_file(follow_symlinks=False):
+                                yield entry
+                            elif recursive and entry.is_dir(follow_symlinks=False):
+                                child_parts = rel_parts + (entry.name,)
+                                if (prune_organized and len(child_parts) == depth
+                                        and self._is_organized_prefix(child_parts)):
+                                    continue
+                                subdirs.append((entry.path, child_parts))
+                        except (PermissionError, OSError):
+                            continue
+            except (PermissionError, OSError):
+                continue
+            # Reverse so subdirectories are visited in listing order
+            stack.extend(reversed(subdirs))
+
+    def _get_scan_subdirs(self, dir_path: str, rel_parts: tuple) -> list[tuple[str, tuple]]:
+        """Get (path, rel_parts) of the subdirectories of dir_path to scan, skipping organized ones."""
+        subdirs = []
+        depth = self._organized_depth()
         try:
-            with os.scandir(directory) as entries:
+            with os.scandir(dir_path) as entries:
                 for entry in entries:
-                    if self._cancel_requested:
-                        return
                     try:
-                        if entry.is_file(follow_symlinks=False):
-                            yield Path(entry.path)
-                        elif entry.is_dir(follow_symlinks=False) and recursive:
-                            yield from self._scan_directory_fast(Path(entry.path), recursive=True)
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                        child_parts = rel_parts + (entry.name,)
+                        if len(child_parts) == depth and self._is_organized_prefix(child_parts):
+                            continue
+                        subdirs.append((entry.path, child_parts))
                     except (PermissionError, OSError):
                         continue
         except (PermissionError, OSError):
             pass
+        return subdirs
+
+    def _get_scan_tasks(self) -> list[tuple[str, tuple, bool]]:
+        """
+        Split the walk below the source folder into (path, rel_parts, recursive) tasks.
 
-    def _get_root_folders(self) -> list[Path]:
-        """Get immediate subdirectories of the source folder."""
+        Each top-level subdirectory starts as one recursive task. While there are fewer
+        tasks than scan workers, recursive tasks are split a level further: the
+        directory's own files become a non-recursive task followed by one task per
+        subdirectory, which keeps the files in the same order as a single walk.
+        """
+        tasks = [(path, parts, True) for path, parts in self._get_scan_subdirs(str(self.source_folder), ())]
+        while len(tasks) < SCAN_WORKERS and any(recursive for _, _, recursive in tasks):
+            if self._cancel_requested:
+                break
+            split = []
+            for path, parts, recursive in tasks:
+                split.append((path, parts, False))
+                if recursive:
+                    split.extend((child_path, child_parts, True)
+                                 for child_path, child_parts in self._get_scan_subdirs(path, parts))
+            tasks = split
+        return tasks
+
+    def _get_root_folders(self) -> list[os.DirEntry]:
+        """Get scandir entries for the immediate subdirectories of the source folder."""
         folders = []
         try:
             with os.scandir(self.source_folder) as entries:
                 for entry in entries:
                     try:
-                        if entry.is_dir(follow_symlinks=False):
-                            folder_path = Path(entry.path)
-                            # Skip if it looks like an organized folder
-                            if not self._is_organized_folder(folder_path):
-                                folders.append(folder_path)
+                        # Skip if it looks like an organized folder
+                        if (entry.is_dir(follow_symlinks=False)
+                                and not self._is_organized_name(entry.name)):
+                            folders.append(entry)
                     except (PermissionError, OSError):
                         continue
         except (PermissionError, OSError):
             pass
         return folders
 
-    def _is_organized_folder(self, folder_path: Path) -> bool:
-        """Check if a folder is part of the organized structure."""
-        name = folder_path.name
-        valid_categories = set(EXTENSION_CATEGORIES.values()) | {'Other', 'No Extension'}
-
+    def _is_organized_name(self, name: str) -> bool:
+        """Check if a folder name is a category, year or month folder name."""
         # Check if it's a category folder
-        if name in valid_categories:
+        if name in VALID_CATEGORIES:
             return True
         # Check if it's a year folder
         if name.isdigit() and len(name) == 4:
             return True
         # Check if it's a month folder
-        if name in MONTH_NAMES.values() or name == "Unknown":
+        if name in VALID_MONTHS:
             return True
         return False
 
@@ -496,19 +740,20 @@ class FileOrganizer:
 
     def get_folder_destination(self, folder_path: Path, folder_date: Optional[datetime] = None) -> Path:
         """Get destination path for a folder (only By Date mode)."""
-        if folder_date:
-            year = str(folder_date.year)
-            month = MONTH_NAMES[folder_date.month]
-        else:
-            year = "Unknown"
-            month = "Unknown"
-        return self.source_folder / year / month / folder_path.name
+        year, month = (folder_date.year, folder_date.month) if folder_date else (0, 0)
+        # Folders are only moved in By Date mode, where the category is not used
+        return self._get_destination_dir('', year, month) / folder_path.name
 
-    def get_folder_date(self, folder_path: Path) -> tuple[datetime, bool]:
-        """Get the date of a folder (oldest file or folder creation date)."""
+    def get_folder_date(self, folder_path: Path,
+                        entry: Optional[os.DirEntry] = None) -> tuple[datetime, bool]:
+        """
+        Get the date of a folder (oldest file or folder creation date).
+
+        Pass the scandir entry when available; on Windows its stat() needs no syscall.
+        """
         try:
             # Use folder's own date
-            stat_info = folder_path.stat()
+            stat_info = entry.stat() if entry is not None else folder_path.stat()
             ctime = stat_info.st_ctime
             mtime = stat_info.st_mtime
             timestamp = min(ctime, mtime)
@@ -519,16 +764,98 @@ class FileOrganizer:
         except (OSError, ValueError, OverflowError):
             return (None, False)
 
-    def scan_files(self, progress_callback: Callable[[str, int], None] = None) -> tuple[list[FileMove], list[SkippedFile], list[FolderMove], bool]:
+    def _plan_file(self, entry: os.DirEntry, planned_moves: list[FileMove],
+                   skipped_files: list[SkippedFile]) -> Optional[FileMove]:
+        """Plan the move for a single scanned file, or record why it was skipped."""
+        file_path = Path(entry.path)
+
+        skip_reason = self.check_file_accessibility(file_path, entry=entry)
+        if skip_reason:
+            skipped_files.append(SkippedFile(file_path, skip_reason))
+            return None
+
+        # Work with plain year/month ints here; no datetime is needed for planning.
+        # By Type ignores dates, so skip the stat (a syscall per file on POSIX)
+        if self.sort_mode == SortMode.BY_TYPE:
+            year, month = 0, 0
+        else:
+            try:
+                year, month = self.get_file_year_month(entry.stat())
+            except OSError:
+                year, month = 0, 0
+        category = self.get_category(entry.name)
+        dest_dir = self._get_destination_dir(category, year, month)
+        dest_path = dest_dir / entry.name
+
+        if not self.check_path_length(dest_path):
+            skipped_files.append(SkippedFile(
+                file_path, SkipReason.PATH_TOO_LONG,
+                f"Path would be {len(str(dest_path))} chars"
+            ))
+            return None
+
+        # dest_path keeps the file name, so the file is in place iff the folders match.
+        # Compare the path strings instead of building a parent Path per file
+        if os.path.normcase(os.path.dirname(entry.path)) == os.path.normcase(str(dest_dir)):
+            return None
+
+        move = FileMove(
+            source=file_path,
+            destination=dest_path,
+            category=category,
+            year=year,
+            month=month,
+            name=entry.name,
+            dest_dir=dest_dir
+        )
+        planned_moves.append(move)
+        return move
+
+    def _scan_subtree(self, directory: Path, recursive: bool, rel_parts: tuple,
+                      on_file: Callable[[int], None],
+                      on_move: Callable[[FileMove], None] = None) -> tuple[list[FileMove], list[SkippedFile]]:
         """
-        Scan files with optimized performance.
+        Scan one directory (optionally recursively) and plan moves for its files.
 
-        Returns: (planned_moves, skipped_files, planned_folder_moves, folders_detected)
+        on_file receives the number of files seen since its last call, every
+        SCAN_PROGRESS_BATCH files and once at the end.
         """
         planned_moves = []
         skipped_files = []
+        # Bound once here; this loop runs for every file in the subtree
+        plan_file = self._plan_file
+        unreported = 0
+        for entry in self._scan_directory_fast(directory, recursive=recursive,
+                                               prune_organized=True, rel_parts=rel_parts):
+            if self._cancel_requested:
+                break
+            unreported += 1
+            if unreported == SCAN_PROGRESS_BATCH:
+                on_file(unreported)
+                unreported = 0
+            move = plan_file(entry, planned_moves, skipped_files)
+            if move and on_move:
+                on_move(move)
+        if unreported:
+            on_file(unreported)
+        return planned_moves, skipped_files
+
+    def scan_files(self, progress_callback: Callable[[str, int], None] = None,
+                   on_move: Callable[[FileMove], None] = None,
+                   reset: bool = True) -> tuple[list[FileMove], list[SkippedFile], list[FolderMove], bool]:
+        """
+        Scan files with optimized performance.
+
+        on_move, if given, is called with each planned file move as soon as it is found.
+        Set reset=False when the caller already cleared the cancel flag, so a cancel
+        requested before the scan starts is not lost.
+
+        Returns: (planned_moves, skipped_files, planned_folder_moves, folders_detected)
+        """
         planned_folder_moves = []
-        self.reset_cancel()
+        if reset:
+            self.reset_cancel()
+        self._dir_mtimes = {}
 
         file_count = 0
         last_update = time.time()
@@ -561,15 +888,16 @@ class FileOrganizer:
             if progress_callback:
                 progress_callback(f"Scanning folders...", 0)
 
-            for folder_path in root_folders:
+            for entry in root_folders:
                 if self._cancel_requested:
                     break
 
-                folder_date, _ = self.get_folder_date(folder_path)
+                folder_path = Path(entry.path)
+                folder_date, _ = self.get_folder_date(folder_path, entry)
                 dest_path = self.get_folder_destination(folder_path, folder_date)
 
                 # Skip if already in correct location
-                if folder_path.resolve() == dest_path.resolve():
+                if self.is_in_correct_location(folder_path, dest_path):
                     continue
 
                 # Check path length
@@ -586,64 +914,120 @@ class FileOrganizer:
                     file_count=file_count_in_folder
                 ))
 
-        # Scan files
-        if scan_recursive:
-            file_iterator = self._scan_directory_fast(self.source_folder, recursive=True)
-        else:
-            file_iterator = self._scan_directory_fast(self.source_folder, recursive=False)
+        count_lock = threading.Lock()
+
+        def on_file(count: int):
+            nonlocal file_count, last_update
+            with count_lock:
+                file_count += count
+                # Batch UI updates for performance
+                now = time.time()
+                if progress_callback and (now - last_update) >= update_interval:
+                    progress_callback(f"Scanning: {file_count} files found...", file_count)
+                    last_update = now
+
+        # Scan root files here; for recursive scans the subtrees are walked on a
+        # thread pool since the walk is bound by stat latency
+        planned_moves, skipped_files = self._scan_subtree(self.source_folder, False, (), on_file, on_move)
+
+        tasks = self._get_scan_tasks() if scan_recursive else []
+        if tasks and not self._cancel_requested:
+            with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(tasks))) as executor:
+                futures = [
+                    executor.submit(self._scan_subtree, Path(path), recursive, parts, on_file, on_move)
+                    for path, parts, recursive in tasks
+                ]
+                # Merge in submission order so results are deterministic
+                for future in futures:
+                    moves, skipped = future.result()
+                    planned_moves.extend(moves)
+                    skipped_files.extend(skipped)
 
-        for file_path in file_iterator:
-            if self._cancel_requested:
-                break
+        # Final update
+        if progress_callback:
+            progress_callback(f"Scan complete: {file_count} files processed", file_count)
 
-            file_count += 1
+        return planned_moves, skipped_files, planned_folder_moves, folders_detected
 
-            # Batch UI updates for performance
-            now = time.time()
-            if progress_callback and (now - last_update) >= update_interval:
-                progress_callback(f"Scanning: {file_count} files found...", file_count)
-                last_update = now
+    def _move_file(self, move: FileMove, result: OrganizeResult, lock: threading.Lock,
+                   recheck: bool = True, denied: Optional[dict[str, tuple[int, int]]] = None):
+        """
+        Move a single file, recording the outcome in result under lock.
 
-            if self.is_in_organized_structure(file_path):
-                continue
+        Set recheck=False when the move was just planned from a fresh scandir entry;
+        the accessibility checks then already ran on its cached stat.
+        denied maps a source folder to (errno, count) of its consecutive permission
+        failures. It must belong to a single worker's sequence of moves, so the
+        count never depends on how other workers interleave.
+        """
+        source_dir = os.path.dirname(str(move.source))
+        if denied and denied.get(source_dir, (0, 0))[1] >= DENIED_MOVES_LIMIT:
+            # A protected folder fails the same way for every file, so stop trying
+            with lock:
+                result.skipped += 1
+                result.skipped_files.append(SkippedFile(
+                    move.source, SkipReason.PERMISSION_DENIED,
+                    "Skipped after repeated permission errors in this folder"))
+            return
 
-            # Skip lock check during scan for speed - will check before move
-            skip_reason = self.check_file_accessibility(file_path, check_lock=False)
+        try:
+            # Re-check in case the file changed since the scan. An open file is
+            # not probed here; the move itself fails and is classified below
+            skip_reason = self.check_file_accessibility(move.source) if recheck else None
             if skip_reason:
-                skipped_files.append(SkippedFile(file_path, skip_reason))
-                continue
-
-            file_date, date_valid = self.get_file_date(file_path)
-            dest_path = self.get_destination_path(file_path, file_date)
-
-            if not self.check_path_length(dest_path):
-                skipped_files.append(SkippedFile(
-                    file_path, SkipReason.PATH_TOO_LONG,
-                    f"Path would be {len(str(dest_path))} chars"
-                ))
-                continue
-
-            if self.is_in_correct_location(file_path, dest_path):
-                continue
+                with lock:
+                    result.skipped += 1
+                    result.skipped_files.append(SkippedFile(move.source, skip_reason))
+                return
 
-            planned_moves.append(FileMove(
-                source=file_path,
-                destination=dest_path,
-                category=self.get_category(file_path),
-                year=file_date.year if file_date else 0,
-                month=file_date.month if file_date else 0
-            ))
+            # The scan already split the destination into folder and name
+            new_name = self._reserve_name(move.dest_dir, move.name)
+            final_dest = move.destination if new_name is None else move.dest_dir / new_name
 
-        # Final update
-        if progress_callback:
-            progress_callback(f"Scan complete: {file_count} files processed", file_count)
+            if not self.check_path_length(final_dest):
+                with lock:
+                    result.skipped += 1
+                    result.skipped_files.append(SkippedFile(move.source, SkipReason.PATH_TOO_LONG))
+                return
 
-        return planned_moves, skipped_files, planned_folder_moves, folders_detected
+            original_path = str(move.source)
+            move_path(original_path, str(final_dest))
+            with lock:
+                result.moved += 1
+                result.move_log.append((original_path, str(final_dest)))
+            if denied:
+                denied.pop(source_dir, None)
+
+        except OSError as e:
+            with lock:
+                # Checked first: Windows reports sharing violations as PermissionError
+                if is_file_in_use_error(e):
+                    result.skipped += 1
+                    result.skipped_files.append(SkippedFile(move.source, SkipReason.FILE_IN_USE, str(e)))
+                elif isinstance(e, PermissionError) or e.errno == errno.EROFS:
+                    result.skipped += 1
+                    result.skipped_files.append(SkippedFile(move.source, SkipReason.PERMISSION_DENIED, str(e)))
+                    if denied is not None:
+                        # A different errno starts a new run rather than extending this one
+                        last_errno, count = denied.get(source_dir, (e.errno, 0))
+                        denied[source_dir] = (e.errno, count + 1 if last_errno == e.errno else 1)
+                else:
+                    result.errors += 1
+                    result.error_messages.append(f"{move.name}: {str(e)}")
+        except Exception as e:
+            with lock:
+                result.errors += 1
+                result.error_messages.append(f"{move.name}: {str(e)}")
 
     def execute_moves(self, planned_moves: list[FileMove],
                       planned_folder_moves: list[FolderMove] = None,
-                      progress_callback: Callable[[int, int, str], None] = None) -> OrganizeResult:
-        """Execute file and folder moves with batched progress updates."""
+                      progress_callback: Callable[[int, int, str], None] = None,
+                      max_workers: int = MOVE_WORKERS) -> OrganizeResult:
+        """
+        Execute file and folder moves with batched progress updates.
+
+        File moves run on up to max_workers threads, one destination folder per thread.
+        """
         result = OrganizeResult()
         planned_folder_moves = planned_folder_moves or []
 
@@ -653,11 +1037,15 @@ class FileOrganizer:
         current = 0
 
         self.reset_cancel()
+        self._dir_names_cache = {}
+        self._name_counters = {}
 
         last_update = time.time()
         update_interval = 0.05  # Update UI every 50ms max for moves
 
-        # First, move folders
+        # First, move folders. Many folders share a year/month destination, so
+        # each destination directory is only created once
+        created_dirs = set()
         for folder_move in planned_folder_moves:
             if self._cancel_requested:
                 result.cancelled = True
@@ -672,7 +1060,10 @@ class FileOrganizer:
                 last_update = now
 
             try:
-                folder_move.destination.parent.mkdir(parents=True, exist_ok=True)
+                parent = folder_move.destination.parent
+                if parent not in created_dirs:
+                    parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(parent)
 
                 # Handle duplicate folder names
                 final_dest = folder_move.destination
@@ -684,10 +1075,10 @@ class FileOrganizer:
                         if counter > 10000:
                             raise RuntimeError("Too many duplicate folders")
 
-                original_path = str(folder_move.source.resolve())
-                shutil.move(str(folder_move.source), str(final_dest))
+                original_path = str(folder_move.source)
+                move_path(original_path, str(final_dest))
                 result.folders_moved += 1
-                result.folder_move_log.append((original_path, str(final_dest.resolve()), folder_move.file_count))
+                result.folder_move_log.append((original_path, str(final_dest), folder_move.file_count))
 
             except PermissionError as e:
                 result.errors += 1
@@ -699,54 +1090,51 @@ class FileOrganizer:
                 result.errors += 1
                 result.error_messages.append(f"Folder {folder_move.source.name}: {str(e)}")
 
-        # Then, move files
+        # Then, move files. Moves are grouped by destination directory and each
+        # group runs on a single worker, so duplicate-name checks never race
+        groups: dict[Path, list[FileMove]] = {}
         for move in planned_moves:
-            if self._cancel_requested:
-                result.cancelled = True
-                break
+            groups.setdefault(move.dest_dir, []).append(move)
 
-            current += 1
+        # Create each destination directory once up front rather than per file
+        for parent in groups:
+            try:
+                parent.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                for move in groups[parent]:
+                    result.errors += 1
+                    result.error_messages.append(f"{move.name}: {str(e)}")
+                groups[parent] = []
 
-            # Batch UI updates
-            now = time.time()
-            if progress_callback and (now - last_update) >= update_interval:
-                progress_callback(current, total, move.source.name)
-                last_update = now
+        lock = threading.Lock()
 
-            try:
-                # Full accessibility check including lock check before move
-                skip_reason = self.check_file_accessibility(move.source, check_lock=True)
-                if skip_reason:
-                    result.skipped += 1
-                    result.skipped_files.append(SkippedFile(move.source, skip_reason))
-                    continue
+        def move_group(moves: list[FileMove]):
+            nonlocal current, last_update
+            # Denial counts are kept per group so they follow this group's own order
+            denied = {}
+            for move in moves:
+                if self._cancel_requested:
+                    return
 
-                move.destination.parent.mkdir(parents=True, exist_ok=True)
-                final_dest = self.get_unique_destination(move.destination)
+                with lock:
+                    current += 1
 
-                if not self.check_path_length(final_dest):
-                    result.skipped += 1
-                    result.skipped_files.append(SkippedFile(move.source, SkipReason.PATH_TOO_LONG))
-                    continue
+                    # Batch UI updates
+                    now = time.time()
+                    if progress_callback and (now - last_update) >= update_interval:
+                        progress_callback(current, total, move.name)
+                        last_update = now
 
-                original_path = str(move.source.resolve())
-                shutil.move(str(move.source), str(final_dest))
-                result.moved += 1
-                result.move_log.append((original_path, str(final_dest.resolve())))
+                self._move_file(move, result, lock, denied=denied)
 
-            except PermissionError as e:
-                result.skipped += 1
-                result.skipped_files.append(SkippedFile(move.source, SkipReason.PERMISSION_DENIED, str(e)))
-            except OSError as e:
-                if "being used" in str(e).lower() or "in use" in str(e).lower():
-                    result.skipped += 1
-                    result.skipped_files.append(SkippedFile(move.source, SkipReason.FILE_IN_USE, str(e)))
-                else:
-                    result.errors += 1
-                    result.error_messages.append(f"{move.source.name}: {str(e)}")
-            except Exception as e:
-                result.errors += 1
-                result.error_messages.append(f"{move.source.name}: {str(e)}")
+        if groups and not self._cancel_requested:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(groups)))) as executor:
+                futures = [executor.submit(move_group, moves) for moves in groups.values()]
+                for future in futures:
+                    future.result()
+
+        if self._cancel_requested:
+            result.cancelled = True
 
         # Final progress update
         if progress_callback:
@@ -754,10 +1142,135 @@ class FileOrganizer:
 
         return result
 
+    def scan_and_execute_moves(self, progress_callback: Callable[[int, int, str], None] = None,
+                               max_workers: int = MOVE_WORKERS
+                               ) -> tuple[OrganizeResult, list[SkippedFile]]:
+        """
+        Scan and move in one pipelined pass.
+
+        The scan feeds planned moves to up to max_workers move threads as it finds
+        them, so files start moving while the rest of the tree is still being
+        scanned. Each destination folder always goes to the same thread, as in
+        execute_moves. Folder moves run once the scan is done. progress_callback
+        receives the number of moves planned so far as its total.
+
+        Returns: (result, skipped_files found during the scan)
+        """
+        result = OrganizeResult()
+        self.reset_cancel()
+        self._dir_names_cache = {}
+        self._name_counters = {}
+
+        lock = threading.Lock()
+        current = 0
+        planned = 0
+        last_update = time.time()
+        update_interval = 0.05  # Update UI every 50ms max for moves
+
+        # Bounded so the scan cannot run arbitrarily far ahead of the moves
+        queues = [queue.Queue(maxsize=256) for _ in range(max(1, max_workers))]
+        # Destination folders are dealt out to the workers as the scan first meets them
+        assigned: dict[Path, queue.Queue] = {}
+
+        def dispatch(move: FileMove):
+            nonlocal planned
+            with lock:
+                planned += 1
+                moves_queue = assigned.get(move.dest_dir)
+                if moves_queue is None:
+                    moves_queue = assigned[move.dest_dir] = queues[len(assigned) % len(queues)]
+            moves_queue.put(move)
+
+        def move_worker(moves_queue: queue.Queue):
+            nonlocal current, last_update
+            created_dirs = set()
+            denied = {}
+            while True:
+                move = moves_queue.get()
+                if move is None:
+                    return
+                # Keep draining after a cancel so the scan never blocks on a full queue
+                if self._cancel_requested:
+                    continue
+
+                with lock:
+                    current += 1
+
+                    # Batch UI updates
+                    now = time.time()
+                    if progress_callback and (now - last_update) >= update_interval:
+                        progress_callback(current, planned, move.name)
+                        last_update = now
+
+                parent = move.dest_dir
+                if parent not in created_dirs:
+                    try:
+                        parent.mkdir(parents=True, exist_ok=True)
+                    except OSError as e:
+                        with lock:
+                            result.errors += 1
+                            result.error_messages.append(f"{move.name}: {str(e)}")
+                        continue
+                    created_dirs.add(parent)
+
+                # Planned moments ago from the scan's own entry, so skip the re-check
+                self._move_file(move, result, lock, recheck=False, denied=denied)
+
+        skipped_files = []
+        planned_folder_moves = []
+        with ThreadPoolExecutor(max_workers=len(queues)) as executor:
+            workers = [executor.submit(move_worker, q) for q in queues]
+            try:
+                _, skipped_files, planned_folder_moves, result.folders_detected = \
+                    self.scan_files(on_move=dispatch, reset=False)
+            except Exception as e:
+                # Keep what was already moved so it still gets a backup
+                with lock:
+                    result.errors += 1
+                    result.error_messages.append(f"Scan failed: {str(e)}")
+            finally:
+                for q in queues:
+                    q.put(None)
+            for worker in workers:
+                worker.result()
+
+        if self._cancel_requested:
+            result.cancelled = True
+        elif planned_folder_moves:
+            folder_result = self.execute_moves([], planned_folder_moves)
+            result.folders_moved = folder_result.folders_moved
+            result.folder_move_log = folder_result.folder_move_log
+            result.errors += folder_result.errors
+            result.error_messages.extend(folder_result.error_messages)
+            result.cancelled = folder_result.cancelled
+
+        if progress_callback:
+            progress_callback(current, current, "Complete")
+
+        return result, skipped_files
+
+
+# Parsed backup headers keyed by backup path, stored with the file's
+# (st_mtime_ns, st_size) so a rewritten or replaced file is read again
+_backup_cache: dict[Path, tuple[tuple[int, int], BackupInfo]] = {}
+
+# Last list_backups_fast() result, stored with the backup folder's st_mtime_ns
+_backup_list_cache: Optional[tuple[int, list[BackupInfo]]] = None
+
 
 class BackupManager:
     """Manages backup and restore operations."""
 
+    @staticmethod
+    def _write_json_array(f, records) -> None:
+        """Write records as a JSON array, one compact record per line."""
+        empty = True
+        for record in records:
+            f.write(b"[\n    " if empty else b",\n    ")
+            f.write(json_dumps(record))
+            empty = False
+        f.write(b"[]" if empty else b"\n  ]")
+
     @staticmethod
     def save_backup(source_folder: str, move_log: list[tuple[str, str]],
                     sort_mode: str, skipped_files: list[SkippedFile] = None) -> Path:
@@ -766,98 +1279,245 @@ class BackupManager:
         filename = f"backup_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
         backup_path = BACKUP_DIR / filename
 
-        backup_data = {
+        # Stream records to the file instead of building the whole document in
+        # memory; the header fields come first and each record gets its own line
+        header = {
             "timestamp": timestamp.isoformat(),
             "source_folder": source_folder,
             "sort_mode": sort_mode,
             "file_count": len(move_log),
-            "moves": [{"original": orig, "destination": dest} for orig, dest in move_log],
-            "skipped": [
-                {"path": str(sf.path), "reason": sf.reason.value, "details": sf.details}
-                for sf in (skipped_files or [])
-            ]
         }
-
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            json.dump(backup_data, f, indent=2, ensure_ascii=False)
+        # Written as bytes so orjson output goes straight to disk without a decode
+        with open(backup_path, 'wb') as f:
+            f.write(b"{\n")
+            for key, value in header.items():
+                f.write(b'  ' + json_dumps(key) + b': ' + json_dumps(value) + b',\n')
+
+            f.write(b'  "moves": ')
+            BackupManager._write_json_array(
+                f, ({"original": orig, "destination": dest} for orig, dest in move_log))
+            f.write(b',\n  "skipped": ')
+            BackupManager._write_json_array(
+                f, ({"path": str(sf.path), "reason": sf.reason.value, "details": sf.details}
+                    for sf in (skipped_files or [])))
+            f.write(b"\n}\n")
+        _backup_cache.pop(backup_path, None)
+        BackupManager._invalidate_list_cache()
         return backup_path
 
     @staticmethod
-    def list_backups() -> list[BackupInfo]:
-        if not BACKUP_DIR.exists():
+    def _invalidate_list_cache() -> None:
+        global _backup_list_cache
+        _backup_list_cache = None
+
+    @staticmethod
+    def _iter_backup_entries():
+        """Yield DirEntry objects for backup files in the backup folder."""
+        try:
+            with os.scandir(BACKUP_DIR) as entries:
+                for entry in entries:
+                    if entry.name.startswith("backup_") and entry.name.endswith(".json"):
+                        yield entry
+        except OSError:
+            return
+
+    @staticmethod
+    def _read_backup_header(filepath: Path) -> dict:
+        """
+        Read the header fields at the top of a backup without parsing the move list.
+
+        Backups are written with one header field per line ahead of "moves", so
+        reading stops there; files in any other layout are parsed in full.
+        """
+        header = {}
+        with open(filepath, 'r', encoding='utf-8') as f:
+            if f.readline().strip() == "{":
+                for line in f:
+                    line = line.strip().rstrip(',')
+                    if line.startswith('"moves"'):
+                        break
+                    try:
+                        header.update(json.loads("{" + line + "}"))
+                    except ValueError:
+                        break
+        if not all(key in header for key in ("timestamp", "source_folder", "file_count")):
+            header = json_load_file(filepath)
+        return header
+
+    @staticmethod
+    def _file_signature(stat_info: os.stat_result) -> tuple[int, int]:
+        return (stat_info.st_mtime_ns, stat_info.st_size)
+
+    @staticmethod
+    def get_backup_info(filepath: Path,
+                        signature: Optional[tuple[int, int]] = None) -> Optional[BackupInfo]:
+        """Read a backup's header fields, reusing the cached result if the file is unchanged."""
+        try:
+            if signature is None:
+                signature = BackupManager._file_signature(filepath.stat())
+            cached = _backup_cache.get(filepath)
+            if cached and cached[0] == signature:
+                return cached[1]
+            data = BackupManager._read_backup_header(filepath)
+            info = BackupInfo(
+                filepath=filepath,
+                timestamp=datetime.fromisoformat(data["timestamp"]),
+                source_folder=data["source_folder"],
+                file_count=data["file_count"]
+            )
+        except (ValueError, KeyError, OSError):
+            return None
+        _backup_cache[filepath] = (signature, info)
+        return info
+
+    @staticmethod
+    def list_backups_fast() -> list[BackupInfo]:
+        """
+        List backups without reading them, using the timestamp in the filename.
+
+        Source folder and file count are filled in from the cache when available,
+        otherwise left as None for get_backup_info to load on demand. The listing
+        itself is reused while the backup folder's mtime is unchanged.
+        """
+        global _backup_list_cache
+        try:
+            dir_mtime = BACKUP_DIR.stat().st_mtime_ns
+        except OSError:
             return []
+        if _backup_list_cache and _backup_list_cache[0] == dir_mtime:
+            # Pick up headers that were read since the listing was cached
+            return [_backup_cache.get(b.filepath, (None, b))[1] for b in _backup_list_cache[1]]
+
         backups = []
-        for filepath in BACKUP_DIR.glob("backup_*.json"):
+        seen = set()
+        for entry in BackupManager._iter_backup_entries():
+            filepath = Path(entry.path)
+            seen.add(filepath)
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                backups.append(BackupInfo(
-                    filepath=filepath,
-                    timestamp=datetime.fromisoformat(data["timestamp"]),
-                    source_folder=data["source_folder"],
-                    file_count=data["file_count"]
-                ))
-            except (json.JSONDecodeError, KeyError, ValueError):
+                stat_info = entry.stat()
+            except OSError:
+                continue
+            cached = _backup_cache.get(filepath)
+            if cached and cached[0] == BackupManager._file_signature(stat_info):
+                backups.append(cached[1])
                 continue
+            try:
+                timestamp = datetime.strptime(entry.name[len("backup_"):-len(".json")], '%Y%m%d_%H%M%S')
+            except ValueError:
+                timestamp = datetime.fromtimestamp(stat_info.st_mtime)
+            backups.append(BackupInfo(filepath=filepath, timestamp=timestamp))
+        # Drop cache entries for backups removed outside the app
+        for filepath in list(_backup_cache):
+            if filepath not in seen:
+                _backup_cache.pop(filepath, None)
         backups.sort(key=lambda b: b.timestamp, reverse=True)
-        return backups
+        _backup_list_cache = (dir_mtime, backups)
+        return list(backups)
 
     @staticmethod
     def load_backup(filepath: Path) -> dict:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return json_load_file(filepath)
 
     @staticmethod
     def execute_restore(backup_data: dict,
                         progress_callback: Callable[[int, int, str], None] = None,
-                        cancel_check: Callable[[], bool] = None) -> OrganizeResult:
+                        cancel_check: Callable[[], bool] = None,
+                        max_workers: int = MOVE_WORKERS) -> OrganizeResult:
+        """
+        Move files from a backup back to their original locations.
+
+        Files are restored on up to max_workers threads, which mostly pays off when
+        they have to be copied back across drives. Moves are grouped by original
+        folder and each group runs on a single worker, so picking a free name and
+        creating the folder never race with another worker.
+        """
         result = OrganizeResult()
         moves = backup_data["moves"]
         total = len(moves)
+        current = 0
 
-        for i, move in enumerate(moves):
-            if cancel_check and cancel_check():
-                result.cancelled = True
-                break
+        last_update = 0.0
+        update_interval = 0.05  # Update UI every 50ms max, always including the last file
 
+        lock = threading.Lock()
+
+        def restore_file(move: dict, created_dirs: set, claimed: set):
+            nonlocal current, last_update
             original = Path(move["original"])
             destination = Path(move["destination"])
 
-            if progress_callback:
-                progress_callback(i + 1, total, destination.name)
+            with lock:
+                current += 1
+
+                # Batch UI updates
+                if progress_callback:
+                    now = time.time()
+                    if current == total or (now - last_update) >= update_interval:
+                        progress_callback(current, total, destination.name)
+                        last_update = now
 
             try:
                 if not destination.exists():
-                    result.skipped += 1
-                    result.skipped_files.append(SkippedFile(
-                        destination, SkipReason.MOVE_ERROR, "File not found"
-                    ))
-                    continue
+                    with lock:
+                        result.skipped += 1
+                        result.skipped_files.append(SkippedFile(
+                            destination, SkipReason.MOVE_ERROR, "File not found"
+                        ))
+                    return
 
-                original.parent.mkdir(parents=True, exist_ok=True)
+                # Only this group's worker restores into this folder, so no lock is needed
+                if original.parent not in created_dirs:
+                    original.parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(original.parent)
                 final_original = original
-                if original.exists():
+                if original.exists() or original in claimed:
                     stem, suffix = original.stem, original.suffix
                     counter = 1
-                    while final_original.exists():
+                    while final_original.exists() or final_original in claimed:
                         final_original = original.parent / f"{stem}_restored_{counter}{suffix}"
                         counter += 1
+                claimed.add(final_original)
 
-                shutil.move(str(destination), str(final_original))
-                result.moved += 1
-                result.move_log.append((str(destination), str(final_original)))
+                move_path(str(destination), str(final_original))
+                with lock:
+                    result.moved += 1
+                    result.move_log.append((str(destination), str(final_original)))
 
             except PermissionError as e:
-                result.skipped += 1
-                result.skipped_files.append(SkippedFile(destination, SkipReason.PERMISSION_DENIED, str(e)))
+                with lock:
+                    result.skipped += 1
+                    result.skipped_files.append(SkippedFile(destination, SkipReason.PERMISSION_DENIED, str(e)))
             except Exception as e:
-                result.errors += 1
-                result.error_messages.append(f"{destination.name}: {str(e)}")
+                with lock:
+                    result.errors += 1
+                    result.error_messages.append(f"{destination.name}: {str(e)}")
+
+        def restore_group(group: list[dict]):
+            # Folders this group created and targets it claimed during this run
+            created_dirs = set()
+            claimed = set()
+            for move in group:
+                if cancel_check and cancel_check():
+                    result.cancelled = True
+                    return
+                restore_file(move, created_dirs, claimed)
+
+        groups: dict[str, list[dict]] = {}
+        for move in moves:
+            groups.setdefault(os.path.normcase(os.path.dirname(move["original"])), []).append(move)
+
+        if groups:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(groups)))) as executor:
+                futures = [executor.submit(restore_group, group) for group in groups.values()]
+                for future in futures:
+                    future.result()
 
         return result
 
     @staticmethod
     def delete_backup(filepath: Path) -> bool:
+        _backup_cache.pop(filepath, None)
+        BackupManager._invalidate_list_cache()
         try:
             filepath.unlink()
             return True
@@ -869,6 +1529,8 @@ class FileOrganizerApp:
     """Main application GUI using ttkbootstrap."""
 
     def __init__(self):
+        _load_gui()
+
         # Create window with ttkbootstrap theme
         if TTKBOOTSTRAP_AVAILABLE:
             self.root = ttk.Window(themename="superhero")
@@ -893,12 +1555,17 @@ class FileOrganizerApp:
         self.skipped_files: list[SkippedFile] = []
         self.folders_detected = False
         self.organizer: Optional[FileOrganizer] = None
+        self._scan_key: Optional[tuple] = None
+        self._scan_cache: Optional[tuple] = None  # (scan key, scan results)
         self.is_processing = False
         self.file_count = 0
 
         # Threading support
         self._task_queue = queue.Queue()
         self._worker_thread: Optional[threading.Thread] = None
+        self._restore_cancelled = False
+        # Latest (percent, message) from a worker; applied once per poll
+        self._pending_progress: Optional[tuple] = None
 
         self._create_widgets()
         self._center_window()
@@ -915,28 +1582,42 @@ class FileOrganizerApp:
 
     def _poll_task_queue(self):
         """Poll the task queue for updates from worker thread."""
+        # Workers only overwrite the latest progress, so the labels are
+        # redrawn at most once per tick however often they report
+        pending = self._pending_progress
+        if pending is not None:
+            self._pending_progress = None
+            percent, message = pending
+            if percent is not None:
+                self._set_progress(percent)
+            self.status_var.set(message)
+
         try:
             while True:
                 task = self._task_queue.get_nowait()
                 task_type = task.get("type")
+                # Completion supersedes any progress reported just before it
+                self._pending_progress = None
 
-                if task_type == "status":
-                    self.status_var.set(task["message"])
-                elif task_type == "progress":
-                    self._set_progress(task["percent"])
-                    if "message" in task:
-                        self.status_var.set(task["message"])
-                elif task_type == "scan_complete":
+                if task_type == "scan_complete":
                     self._on_scan_complete(task["moves"], task["skipped"], task["folder_moves"],
-                                          task["folders_detected"], task["cancelled"])
+                                          task["folders_detected"], task["cancelled"], task["summary"],
+                                          task["dir_mtimes"])
                 elif task_type == "organize_complete":
-                    self._on_organize_complete(task["result"], task["all_skipped"], task["backup_path"])
+                    self._on_organize_complete(task["result"], task["all_skipped"], task["backup_path"],
+                                               task["error"])
+                elif task_type == "restore_complete":
+                    self._on_restore_complete(task["backup_info"], task["result"], task["error"])
         except queue.Empty:
             pass
 
         # Continue polling
         self.root.after(50, self._poll_task_queue)
 
+    def _post_progress(self, message: str, percent: Optional[float] = None):
+        """Record worker progress for the next poll of the task queue."""
+        self._pending_progress = (percent, message)
+
     def _run_in_thread(self, target, *args):
         """Run a function in a background thread."""
         self._worker_thread = threading.Thread(target=target, args=args, daemon=True)
@@ -1119,6 +1800,7 @@ class FileOrganizerApp:
         self.progress_pct = ttk.Label(status_row, text="", font=("Segoe UI", 10, "bold"),
                                      **self._bootstyle("success"))
         self.progress_pct.pack(side="right")
+        self._progress_text = ""
 
     def _create_chart_section(self):
         """Create the pie chart section for file extension analysis."""
@@ -1356,6 +2038,7 @@ class FileOrganizerApp:
 
             self.selected_folder.set(folder)
             self.planned_moves = []
+            self.planned_folder_moves = []
             self.skipped_files = []
             self._clear_results()
             self._update_button_states()
@@ -1387,7 +2070,9 @@ class FileOrganizerApp:
     def _cancel_operation(self):
         if self.organizer:
             self.organizer.request_cancel()
-            self.status_var.set("Cancelling...")
+        # Also stops a running restore, which has no organizer of its own
+        self._restore_cancelled = True
+        self.status_var.set("Cancelling...")
 
     def _clear_results(self):
         for widget in self.results_inner.winfo_children():
@@ -1398,39 +2083,54 @@ class FileOrganizerApp:
 
     def _set_progress(self, percent: float):
         self.progress_bar["value"] = percent
-        if percent > 0:
-            self.progress_pct.configure(text=f"{int(percent)}%")
-        else:
-            self.progress_pct.configure(text="")
+        # The label only shows whole percents, so most updates leave it unchanged
+        text = f"{int(percent)}%" if percent > 0 else ""
+        if text != self._progress_text:
+            self._progress_text = text
+            self.progress_pct.configure(text=text)
 
     def _add_result_header(self, text: str, icon: str = "", style: str = ""):
-        frame = ttk.Frame(self.results_inner)
-        frame.pack(fill="x", pady=(12, 6))
-
         full_text = f"{icon}  {text}" if icon else text
-        label = ttk.Label(frame, text=full_text, font=("Segoe UI", 11, "bold"),
+        # Result rows are packed straight into the results frame; a wrapper Frame
+        # per row would double the widgets the geometry manager lays out
+        label = ttk.Label(self.results_inner, text=full_text, font=("Segoe UI", 11, "bold"),
                          **self._bootstyle(style) if style else {})
-        label.pack(side="left")
+        label.pack(anchor="w", pady=(12, 6))
 
     def _add_result_item(self, icon: str, text: str, style: str = "", indent: int = 0):
-        frame = ttk.Frame(self.results_inner, padding=(indent * 20, 2, 0, 2))
-        frame.pack(fill="x")
-
         full_text = f"{icon}  {text}" if icon else text
-        label = ttk.Label(frame, text=full_text, font=("Segoe UI", 10),
-                         **self._bootstyle(style) if style else {})
-        label.pack(side="left")
+        label = ttk.Label(self.results_inner, text=full_text, font=("Segoe UI", 10),
+                         padding=(indent * 20, 2, 0, 2), **self._bootstyle(style) if style else {})
+        label.pack(anchor="w")
 
-    def _add_tree_item(self, text: str, level: int = 0):
-        frame = ttk.Frame(self.results_inner)
-        frame.pack(fill="x", pady=1)
+    def _add_result_items(self, items: list[tuple[str, str]], style: str = "", indent: int = 0):
+        """Add several (icon, text) result lines as a single multi-line label."""
+        if not items:
+            return
+        text = "\n".join(f"{icon}  {line}" if icon else line for icon, line in items)
+        label = ttk.Label(self.results_inner, text=text, font=("Segoe UI", 10), justify="left",
+                         padding=(indent * 20, 2, 0, 2), **self._bootstyle(style) if style else {})
+        label.pack(anchor="w")
 
+    @staticmethod
+    def _format_tree_line(text: str, level: int) -> str:
         indent = "    " * level
         prefix = "--- " if level > 0 else ""
+        return f"{indent}{prefix}{text}"
 
-        label = ttk.Label(frame, text=f"{indent}{prefix}{text}",
+    def _add_tree_item(self, text: str, level: int = 0):
+        label = ttk.Label(self.results_inner, text=self._format_tree_line(text, level),
                          font=("Consolas", 10), **self._bootstyle("secondary"))
-        label.pack(side="left")
+        label.pack(anchor="w", pady=1)
+
+    def _add_tree_block(self, items: list[tuple[str, int]]):
+        """Add several (text, level) tree lines as a single multi-line label."""
+        if not items:
+            return
+        text = "\n".join(self._format_tree_line(line, level) for line, level in items)
+        label = ttk.Label(self.results_inner, text=text, font=("Consolas", 10), justify="left",
+                         **self._bootstyle("secondary"))
+        label.pack(anchor="w", pady=1)
 
     def _show_success_state(self, moved: int, skipped: int, errors: int):
         self.status_indicator.pack(fill="x", pady=(0, 12))
@@ -1468,6 +2168,17 @@ class FileOrganizerApp:
             flatten_folders=self.flatten_folders.get()
         )
 
+    def _prepare_organizer(self, folder: str, sort_mode: SortMode, options: ScanOptions):
+        """Reuse the current organizer when its settings match, else create one."""
+        # Keeps the destination folder cache built by a preview for the organize run
+        organizer = self.organizer
+        if (organizer is None or organizer.source_folder != Path(os.path.abspath(folder))
+                or organizer.sort_mode != sort_mode or organizer.options != options):
+            self.organizer = FileOrganizer(folder, sort_mode, options)
+        else:
+            # A cancelled preview leaves the flag set
+            organizer.reset_cancel()
+
     def _preview(self):
         folder = self.selected_folder.get()
         if not folder:
@@ -1483,29 +2194,97 @@ class FileOrganizerApp:
 
         sort_mode = self._get_sort_mode()
         options = self._get_scan_options()
-        self.organizer = FileOrganizer(folder, sort_mode, options)
+        self._prepare_organizer(folder, sort_mode, options)
+
+        # Reuse the last scan if nothing in the folder changed since then
+        self._scan_key = self._get_scan_key(folder, sort_mode, options)
+        if self._scan_cache and self._scan_cache[0] == self._scan_key:
+            moves, skipped, folder_moves, folders_detected, summary, dir_mtimes = self._scan_cache[1]
+            if self._dirs_unchanged(dir_mtimes):
+                self._on_scan_complete(list(moves), skipped, folder_moves, folders_detected, False,
+                                       summary, dir_mtimes)
+                return
+            self._scan_cache = None
 
         # Run scan in background thread
         self._run_in_thread(self._scan_worker, folder, sort_mode, options)
 
+    @staticmethod
+    def _get_scan_key(folder: str, sort_mode: SortMode, options: ScanOptions) -> tuple:
+        """Build the cache key for a scan: folder, mode and options."""
+        return (folder, sort_mode, astuple(options))
+
+    @staticmethod
+    def _dirs_unchanged(dir_mtimes: dict[str, int]) -> bool:
+        """
+        Check that no directory listed by a scan has changed since.
+
+        A directory's mtime changes when entries are added, removed or renamed in
+        it, so this costs one stat per directory instead of a full rescan.
+        """
+        try:
+            return bool(dir_mtimes) and all(os.stat(path).st_mtime_ns == mtime
+                                            for path, mtime in dir_mtimes.items())
+        except OSError:
+            return False
+
     def _scan_worker(self, folder: str, sort_mode: SortMode, options: ScanOptions):
         """Background worker for scanning files."""
         def progress_callback(msg: str, count: int):
-            self._task_queue.put({"type": "status", "message": msg})
+            self._post_progress(msg)
 
         moves, skipped, folder_moves, folders_detected = self.organizer.scan_files(progress_callback=progress_callback)
         cancelled = self.organizer._cancel_requested
 
+        # Aggregate the preview here so the Tk thread never walks the full move list
+        summary = None
+        if not cancelled:
+            summary = self._summarize_moves(moves, sort_mode)
+
         self._task_queue.put({
             "type": "scan_complete",
             "moves": moves,
             "skipped": skipped,
             "folder_moves": folder_moves,
             "folders_detected": folders_detected,
-            "cancelled": cancelled
+            "cancelled": cancelled,
+            "summary": summary,
+            "dir_mtimes": dict(self.organizer._dir_mtimes)
         })
 
-    def _on_scan_complete(self, moves: list, skipped: list, folder_moves: list, folders_detected: bool, cancelled: bool):
+    @staticmethod
+    def _extension_label(name: str) -> str:
+        dot = name.rfind('.')
+        return name[dot:].lower() if 0 < dot < len(name) - 1 else "(no ext)"
+
+    @staticmethod
+    def _summarize_moves(moves: list[FileMove], sort_mode: SortMode) -> tuple[dict, dict]:
+        """Build extension counts and the category/year/month tree for a preview."""
+        # One hashed count per move; the tree is then built from the distinct
+        # (category, year, month) keys, of which there are only a handful
+        extension_counts = Counter(map(FileOrganizerApp._extension_label, (move.name for move in moves)))
+        tree_counts = Counter((move.category, move.year, move.month) for move in moves)
+
+        categories = {}
+        for (category, year, month), count in tree_counts.items():
+            cat_data = categories.setdefault(category, {"years": {}, "count": 0})
+            cat_data["count"] += count
+
+            if sort_mode != SortMode.BY_TYPE:
+                year_name = str(year) if year else "Unknown"
+                year_data = cat_data["years"].setdefault(year_name, {"months": set(), "count": 0})
+                year_data["count"] += count
+                year_data["months"].add(MONTH_NAMES.get(month, "Unknown") if month else "Unknown")
+
+        # Order the tree here, off the Tk thread, so rendering is a straight walk
+        for cat_data in categories.values():
+            cat_data["years"] = dict(sorted(cat_data["years"].items()))
+            for year_data in cat_data["years"].values():
+                year_data["months"] = sorted(year_data["months"])
+        return extension_counts, dict(sorted(categories.items()))
+
+    def _on_scan_complete(self, moves: list, skipped: list, folder_moves: list, folders_detected: bool,
+                          cancelled: bool, summary: Optional[tuple[dict, dict]], dir_mtimes: dict[str, int]):
         """Called on main thread when scan completes."""
         self.planned_moves = moves
         self.planned_folder_moves = folder_moves
@@ -1515,6 +2294,10 @@ class FileOrganizerApp:
         self._update_button_states()
         self._show_cancel_button(False)
 
+        if not cancelled:
+            self._scan_cache = (self._scan_key,
+                                (moves, skipped, folder_moves, folders_detected, summary, dir_mtimes))
+
         if cancelled:
             self.status_var.set("Preview cancelled.")
             self._add_result_header("Preview was cancelled", ICON_WARNING, "warning")
@@ -1545,11 +2328,8 @@ class FileOrganizerApp:
                                      **self._bootstyle("warning"))
             warning_label.pack(pady=8)
 
-        # Build extension counts for pie chart
-        extension_counts = {}
-        for move in self.planned_moves:
-            ext = move.source.suffix.lower() if move.source.suffix else "(no ext)"
-            extension_counts[ext] = extension_counts.get(ext, 0) + 1
+        # Extension counts and folder tree were built on the worker thread
+        extension_counts, categories = summary
 
         # Update pie chart
         self._draw_pie_chart(extension_counts)
@@ -1577,52 +2357,58 @@ class FileOrganizerApp:
         if self.planned_moves:
             self._add_result_header(f"Folder Structure Preview ({len(self.planned_moves)} files)")
 
-            # Build tree structure
-            categories = {}
-            for move in self.planned_moves:
-                if move.category not in categories:
-                    categories[move.category] = {"years": {}, "count": 0}
-                categories[move.category]["count"] += 1
-
-                if sort_mode != SortMode.BY_TYPE:
-                    year = str(move.year) if move.year else "Unknown"
-                    if year not in categories[move.category]["years"]:
-                        categories[move.category]["years"][year] = {"months": set(), "count": 0}
-                    categories[move.category]["years"][year]["count"] += 1
-                    month = MONTH_NAMES.get(move.month, "Unknown") if move.month else "Unknown"
-                    categories[move.category]["years"][year]["months"].add(month)
-
             # Display tree
             folder_name = Path(folder).name
             self._add_tree_item(f"{ICON_FOLDER} {folder_name}/", 0)
 
-            for cat, cat_data in sorted(categories.items()):
-                if sort_mode == SortMode.BY_TYPE:
-                    self._add_tree_item(f"{ICON_FOLDER} {cat}/  ({cat_data['count']} files)", 1)
-                elif sort_mode == SortMode.BY_DATE:
-                    for year, year_data in sorted(cat_data["years"].items()):
-                        self._add_tree_item(f"{ICON_FOLDER} {year}/", 1)
-                        for month in sorted(year_data["months"]):
-                            self._add_tree_item(f"{ICON_FOLDER} {month}/", 2)
-                else:
-                    self._add_tree_item(f"{ICON_FOLDER} {cat}/", 1)
-                    for year, year_data in sorted(cat_data["years"].items()):
-                        self._add_tree_item(f"{ICON_FOLDER} {year}/", 2)
-                        for month in sorted(year_data["months"]):
-                            self._add_tree_item(f"{ICON_FOLDER} {month}/", 3)
+            # Each block below is one label, so the widget count grows with the
+            # number of categories rather than with every year and month line
+            blocks = []
+            if sort_mode == SortMode.BY_TYPE:
+                blocks.append([(f"{ICON_FOLDER} {cat}/  ({cat_data['count']} files)", 1)
+                               for cat, cat_data in categories.items()])
+            elif sort_mode == SortMode.BY_DATE:
+                # There is no category level in this layout, so merge the years
+                years = {}
+                for cat_data in categories.values():
+                    for year, year_data in cat_data["years"].items():
+                        years.setdefault(year, set()).update(year_data["months"])
+                lines = []
+                for year, months in sorted(years.items()):
+                    lines.append((f"{ICON_FOLDER} {year}/", 1))
+                    lines.extend((f"{ICON_FOLDER} {month}/", 2) for month in sorted(months))
+                blocks.append(lines)
+            else:
+                for cat, cat_data in categories.items():
+                    lines = [(f"{ICON_FOLDER} {cat}/", 1)]
+                    for year, year_data in cat_data["years"].items():
+                        lines.append((f"{ICON_FOLDER} {year}/", 2))
+                        lines.extend((f"{ICON_FOLDER} {month}/", 3) for month in year_data["months"])
+                    blocks.append(lines)
+
+            # Files spread over decades can give thousands of month folders, so only
+            # the first lines are laid out; the rest are summarized in one line
+            remaining = PREVIEW_TREE_MAX_LINES
+            for lines in blocks:
+                if remaining > 0:
+                    self._add_tree_block(lines[:remaining])
+                remaining -= len(lines)
+            if remaining < 0:
+                self._add_result_item("", f"... and {-remaining} more folders", "secondary", 1)
 
         # Show folder moves preview
         if self.planned_folder_moves:
             total_files_in_folders = sum(fm.file_count for fm in self.planned_folder_moves)
             self._add_result_header(f"Folders to Move ({len(self.planned_folder_moves)} folders, {total_files_in_folders} files)")
 
+            items = []
             for fm in self.planned_folder_moves[:10]:
                 year = str(fm.year) if fm.year else "Unknown"
                 month = MONTH_NAMES.get(fm.month, "Unknown") if fm.month else "Unknown"
-                self._add_result_item(ICON_FOLDER, f"{fm.source.name}/ -> {year}/{month}/ ({fm.file_count} files)",
-                                      "secondary", 1)
+                items.append((ICON_FOLDER, f"{fm.source.name}/ -> {year}/{month}/ ({fm.file_count} files)"))
             if len(self.planned_folder_moves) > 10:
-                self._add_result_item("", f"... and {len(self.planned_folder_moves) - 10} more folders", "secondary", 1)
+                items.append(("", f"... and {len(self.planned_folder_moves) - 10} more folders"))
+            self._add_result_items(items, "secondary", 1)
 
         # Show skipped files
         if self.skipped_files:
@@ -1634,9 +2420,8 @@ class FileOrganizerApp:
                     by_reason[sf.reason] = []
                 by_reason[sf.reason].append(sf)
 
-            for reason, files in by_reason.items():
-                self._add_result_item(ICON_WARNING, f"{reason.value}: {len(files)} files",
-                                      "warning", 1)
+            self._add_result_items([(ICON_WARNING, f"{reason.value}: {len(files)} files")
+                                    for reason, files in by_reason.items()], "warning", 1)
 
         self._set_progress(100)
         status_parts = []
@@ -1655,24 +2440,20 @@ class FileOrganizerApp:
         sort_mode = self._get_sort_mode()
         options = self._get_scan_options()
 
-        if not self.planned_moves and not self.planned_folder_moves:
-            # Quick synchronous scan if no preview was done
-            self.organizer = FileOrganizer(folder, sort_mode, options)
-            self.planned_moves, self.skipped_files, self.planned_folder_moves, self.folders_detected = self.organizer.scan_files()
-
-            if not self.planned_moves and not self.planned_folder_moves:
-                messagebox.showinfo("Nothing to Do", "No files or folders need to be organized.")
-                return
-
         # Confirmation dialog
-        msg_parts = []
-        if self.planned_moves:
-            msg_parts.append(f"{len(self.planned_moves)} files")
-        if self.planned_folder_moves:
-            msg_parts.append(f"{len(self.planned_folder_moves)} folders")
-        msg = f"This will organize {' and '.join(msg_parts)}."
-        if self.skipped_files:
-            msg += f"\n{len(self.skipped_files)} files will be skipped."
+        if self.planned_moves or self.planned_folder_moves:
+            msg_parts = []
+            if self.planned_moves:
+                msg_parts.append(f"{len(self.planned_moves)} files")
+            if self.planned_folder_moves:
+                msg_parts.append(f"{len(self.planned_folder_moves)} folders")
+            msg = f"This will organize {' and '.join(msg_parts)}."
+            if self.skipped_files:
+                msg += f"\n{len(self.skipped_files)} files will be skipped."
+        else:
+            # No preview - files are moved as the scan finds them
+            msg = f"This will organize all files in '{Path(folder).name}'."
+            msg += "\n\nClick 'Preview Changes' first to see what will be moved."
         if options.delete_empty_folders:
             msg += "\n\nEmpty folders will be deleted."
         msg += "\n\nA backup will be created automatically."
@@ -1686,52 +2467,86 @@ class FileOrganizerApp:
         self._update_button_states()
         self._show_cancel_button(True)
 
-        self.organizer = FileOrganizer(folder, sort_mode, options)
+        self._prepare_organizer(folder, sort_mode, options)
 
         # Run organize in background thread
         self._run_in_thread(self._organize_worker, folder, sort_mode, options)
 
     def _organize_worker(self, folder: str, sort_mode: SortMode, options: ScanOptions):
         """Background worker for organizing files."""
-        total_items = len(self.planned_moves) + len(self.planned_folder_moves)
-
         def move_progress(current, total, name):
-            percent = (current / total) * 100 if total > 0 else 100
-            self._task_queue.put({
-                "type": "progress",
-                "percent": percent,
-                "message": f"Moving {current} of {total}: {name}"
-            })
-
-        result = self.organizer.execute_moves(
-            self.planned_moves,
-            self.planned_folder_moves,
-            progress_callback=move_progress
-        )
-        all_skipped = self.skipped_files + result.skipped_files
+            if total == 0:
+                self._post_progress(f"Moving {current}: {name}")
+                return
+            self._post_progress(f"Moving {current} of {total}: {name}", (current / total) * 100)
 
-        # Save backup
+        result = None
+        all_skipped = []
         backup_path = None
-        if result.move_log or result.folder_move_log:
-            backup_path = BackupManager.save_backup(folder, result.move_log, sort_mode.value, all_skipped)
-
-        # Delete empty folders
-        if options.delete_empty_folders and (result.moved > 0 or result.folders_moved > 0):
-            self._task_queue.put({"type": "status", "message": "Cleaning up empty folders..."})
-            delete_empty_folders(Path(folder))
+        error = None
+        try:
+            if self.planned_moves or self.planned_folder_moves:
+                result = self.organizer.execute_moves(
+                    self.planned_moves,
+                    self.planned_folder_moves,
+                    progress_callback=move_progress
+                )
+                all_skipped = self.skipped_files + result.skipped_files
+            else:
+                # No preview - overlap scanning and moving
+                result, scan_skipped = self.organizer.scan_and_execute_moves(progress_callback=move_progress)
+                all_skipped = scan_skipped + result.skipped_files
+
+            # Delete empty folders on a second thread while the backup is written; the two
+            # touch separate trees unless the backup folder sits inside this one
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                cleanup = None
+                if options.delete_empty_folders and (result.moved > 0 or result.folders_moved > 0):
+                    self._post_progress("Cleaning up empty folders...")
+                    cleanup = executor.submit(delete_empty_folders, Path(folder))
+                    if Path(os.path.abspath(folder)) in BACKUP_DIR.parents:
+                        cleanup.result()
+
+                if result.move_log or result.folder_move_log:
+                    backup_path = BackupManager.save_backup(folder, result.move_log, sort_mode.value, all_skipped)
+                if cleanup:
+                    cleanup.result()
+        except Exception as e:
+            error = str(e)
 
+        # Always report back, otherwise the window stays stuck in processing
         self._task_queue.put({
             "type": "organize_complete",
             "result": result,
             "all_skipped": all_skipped,
-            "backup_path": backup_path
+            "backup_path": backup_path,
+            "error": error
         })
 
-    def _on_organize_complete(self, result: OrganizeResult, all_skipped: list, backup_path: Optional[Path]):
+    def _on_organize_complete(self, result: Optional[OrganizeResult], all_skipped: list,
+                              backup_path: Optional[Path], error: Optional[str]):
         """Called on main thread when organize completes."""
         self.is_processing = False
         self._update_button_states()
         self._show_cancel_button(False)
+        # Files have moved (or may have), so a cached preview no longer applies
+        self._scan_cache = None
+
+        if result is None:
+            self._clear_results()
+            self._set_progress(0)
+            self.status_var.set("Organization failed")
+            messagebox.showerror("Error", f"Organization failed: {error}")
+            return
+
+        if error is None and not result.cancelled and not (
+                result.moved or result.folders_moved or result.skipped or result.errors):
+            # The scan found nothing to move
+            self._clear_results()
+            self._set_progress(0)
+            self.status_var.set("No files need to be organized.")
+            messagebox.showinfo("Nothing to Do", "No files or folders need to be organized.")
+            return
 
         total_moved = result.moved + result.folders_moved
 
@@ -1755,18 +2570,16 @@ class FileOrganizerApp:
         # Show moved folders
         if result.folders_moved > 0:
             self._add_result_header(f"Moved Folders ({result.folders_moved})", ICON_CHECK, "success")
-            for orig, dest, file_count in result.folder_move_log[:5]:
-                folder_name = Path(dest).name
-                self._add_result_item(ICON_FOLDER, f"{folder_name}/ ({file_count} files)", "success", 1)
+            self._add_result_items([(ICON_FOLDER, f"{Path(dest).name}/ ({file_count} files)")
+                                    for orig, dest, file_count in result.folder_move_log[:5]], "success", 1)
             if len(result.folder_move_log) > 5:
                 self._add_result_item("", f"... and {len(result.folder_move_log) - 5} more folders", "secondary", 1)
 
         # Show moved files
         self._add_result_header(f"Moved Files ({result.moved})", ICON_CHECK, "success")
         if result.move_log:
-            for orig, dest in result.move_log[:5]:
-                dest_name = Path(dest).name
-                self._add_result_item(ICON_CHECK, dest_name, "success", 1)
+            self._add_result_items([(ICON_CHECK, Path(dest).name) for orig, dest in result.move_log[:5]],
+                                   "success", 1)
             if len(result.move_log) > 5:
                 self._add_result_item("", f"... and {len(result.move_log) - 5} more files",
                                       "secondary", 1)
@@ -1778,25 +2591,32 @@ class FileOrganizerApp:
                 if sf.reason not in by_reason:
                     by_reason[sf.reason] = 0
                 by_reason[sf.reason] += 1
-            for reason, count in by_reason.items():
-                self._add_result_item(ICON_WARNING, f"{reason.value}: {count}", "warning", 1)
+            self._add_result_items([(ICON_WARNING, f"{reason.value}: {count}")
+                                    for reason, count in by_reason.items()], "warning", 1)
 
         if result.errors > 0:
             self._add_result_header(f"Errors ({result.errors})", ICON_ERROR, "danger")
-            for err in result.error_messages[:5]:
-                self._add_result_item(ICON_ERROR, err, "danger", 1)
+            self._add_result_items([(ICON_ERROR, err) for err in result.error_messages[:5]], "danger", 1)
 
         if backup_path:
             self._add_result_header("Backup Created")
             self._add_result_item(ICON_FILE, backup_path.name, "secondary", 1)
 
-        self._set_progress(100)
-        self.status_var.set(f"Complete! Moved {result.moved} files.")
         self.planned_moves = []
+        self.planned_folder_moves = []
         self.skipped_files = []
 
+        if error is not None:
+            self.status_var.set(f"Organization stopped. Moved {result.moved} files.")
+            messagebox.showerror("Error", f"Organization did not finish: {error}")
+            return
+
+        self._set_progress(100)
+        self.status_var.set(f"Complete! Moved {result.moved} files.")
+
     def _show_restore_dialog(self):
-        backups = BackupManager.list_backups()
+        # Only filenames are read here; details are loaded when a row is selected
+        backups = BackupManager.list_backups_fast()
 
         if not backups:
             messagebox.showinfo("No Backups", "No backup files found.\n\nBackups are created when you organize files.")
@@ -1844,12 +2664,33 @@ class FileOrganizerApp:
         tree.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
+        def row_values(backup: BackupInfo) -> tuple:
+            if backup.file_count is None:
+                return (backup.timestamp.strftime('%Y-%m-%d %H:%M:%S'), "...", "...")
+            return (backup.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+                    backup.file_count, backup.source_folder)
+
         for backup in backups:
-            tree.insert("", "end", values=(
-                backup.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-                backup.file_count,
-                backup.source_folder
-            ))
+            tree.insert("", "end", values=row_values(backup))
+
+        def load_details(item) -> Optional[BackupInfo]:
+            idx = tree.index(item)
+            backup = backups[idx]
+            if backup.file_count is None:
+                info = BackupManager.get_backup_info(backup.filepath)
+                if info is None:
+                    tree.item(item, values=(backup.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+                                            "-", "(unreadable backup)"))
+                    return None
+                backups[idx] = backup = info
+                tree.item(item, values=row_values(backup))
+            return backup
+
+        def on_select(event):
+            for item in tree.selection():
+                load_details(item)
+
+        tree.bind("<<TreeviewSelect>>", on_select)
 
         btn_frame = ttk.Frame(frame)
         btn_frame.pack(fill="x")
@@ -1859,8 +2700,10 @@ class FileOrganizerApp:
             if not sel:
                 messagebox.showwarning("No Selection", "Please select a backup.", parent=dialog)
                 return
-            idx = tree.index(sel[0])
-            backup = backups[idx]
+            backup = load_details(sel[0])
+            if backup is None:
+                messagebox.showerror("Error", "This backup file could not be read.", parent=dialog)
+                return
             if messagebox.askyesno("Confirm", f"Restore {backup.file_count} files?", parent=dialog):
                 dialog.destroy()
                 self._execute_restore(backup)
@@ -1887,55 +2730,64 @@ class FileOrganizerApp:
                   **self._bootstyle("secondary-link")).pack(side="right")
 
     def _execute_restore(self, backup_info: BackupInfo):
+        self._scan_cache = None
         self._clear_results()
         self._set_progress(0)
         self.status_var.set("Loading backup...")
         self.is_processing = True
+        self._restore_cancelled = False
         self._update_button_states()
         self._show_cancel_button(True)
-        self.root.update_idletasks()
-
-        try:
-            backup_data = BackupManager.load_backup(backup_info.filepath)
-        except Exception as e:
-            self.is_processing = False
-            self._update_button_states()
-            self._show_cancel_button(False)
-            messagebox.showerror("Error", f"Failed to load backup: {e}")
-            return
 
         self._add_result_header("Restoring from Backup")
         self._add_result_item(ICON_CALENDAR, backup_info.timestamp.strftime('%Y-%m-%d %H:%M:%S'), "secondary", 1)
         self._add_result_item(ICON_FILE, f"{backup_info.file_count} files to restore", "secondary", 1)
 
-        cancel_flag = [False]
-
-        def check_cancel():
-            return cancel_flag[0]
+        # Run in background thread so the window stays responsive and Cancel works
+        self._run_in_thread(self._restore_worker, backup_info)
 
+    def _restore_worker(self, backup_info: BackupInfo):
+        """Background worker for restoring files from a backup."""
         def restore_progress(current, total, filename):
-            percent = (current / total) * 100
-            self._set_progress(percent)
-            self.status_var.set(f"Restoring file {current} of {total}: {filename}")
-            self.root.update_idletasks()
-
-        original_cancel = self._cancel_operation
+            self._post_progress(f"Restoring file {current} of {total}: {filename}",
+                                (current / total) * 100)
 
-        def cancel_restore():
-            cancel_flag[0] = True
-            self.status_var.set("Cancelling...")
-
-        self._cancel_operation = cancel_restore
+        result = None
+        error = None
+        try:
+            backup_data = BackupManager.load_backup(backup_info.filepath)
+            result = BackupManager.execute_restore(backup_data, restore_progress,
+                                                   lambda: self._restore_cancelled)
+        except Exception as e:
+            error = str(e)
 
-        result = BackupManager.execute_restore(backup_data, restore_progress, check_cancel)
+        # Always report back, otherwise the window stays stuck in processing
+        self._task_queue.put({
+            "type": "restore_complete",
+            "backup_info": backup_info,
+            "result": result,
+            "error": error
+        })
 
-        self._cancel_operation = original_cancel
+    def _on_restore_complete(self, backup_info: BackupInfo, result: Optional[OrganizeResult],
+                             error: Optional[str]):
+        """Called on main thread when a restore completes."""
         self.is_processing = False
         self._update_button_states()
         self._show_cancel_button(False)
 
+        if error is not None:
+            self._clear_results()
+            self._set_progress(0)
+            self.status_var.set("Restore failed")
+            messagebox.showerror("Error", f"Restore failed: {error}")
+            return
+
         self._show_success_state(result.moved, result.skipped, result.errors)
 
+        if result.cancelled:
+            self._add_result_header("Restore Cancelled", ICON_WARNING, "warning")
+
         self._add_result_header(f"Restored ({result.moved} files)", ICON_CHECK, "success")
 
         if result.skipped > 0:
@@ -1944,8 +2796,11 @@ class FileOrganizerApp:
         if result.errors > 0:
             self._add_result_header(f"Errors ({result.errors})", ICON_ERROR, "danger")
 
-        self._set_progress(100)
-        self.status_var.set(f"Restore complete! {result.moved} files restored.")
+        if result.cancelled:
+            self.status_var.set(f"Restore cancelled. {result.moved} files restored.")
+        else:
+            self._set_progress(100)
+            self.status_var.set(f"Restore complete! {result.moved} files restored.")
 
         if result.moved > 0 and result.errors == 0 and not result.cancelled:
             if messagebox.askyesno("Success", f"Restored {result.moved} files.\n\nDelete backup?"):